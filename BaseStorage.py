@@ -1,9 +1,7 @@
 import sqlite3
-import json
 from abc import ABC, abstractmethod
-from dataclasses import asdict
-from typing import List
-from DataTypes import Faculty
+from typing import List, Optional
+from DataTypes import Faculty, json_loads
 
 
 # --- Storage Interface (SoC) ---
@@ -12,13 +10,42 @@ class BaseStorage(ABC):
     def save_faculty(self, faculty_list: List[Faculty]): pass
     
     @abstractmethod
-    def search_cache(self, keyword: str) -> List[Faculty]: pass
+    def search_cache(self, keywords: List[str], institution: Optional[str] = None,
+                     limit: Optional[int] = None) -> List[Faculty]: pass
 
 # --- SQLite Implementation ---
 class SQLiteStorage(BaseStorage):
+    FTS_SCHEMA_VERSION = 3
+    SEARCH_LIMIT = 200
+    FACULTY_CACHE_SIZE = 512
+
+    # Fixed SQL text so sqlite3's statement cache hands back the same prepared statement
+    _INSERT_FACULTY_SQL = "INSERT OR REPLACE INTO faculty (id, name, h_index, institution, data_json) VALUES (?, ?, ?, ?, ?)"
+    _INSERT_SEARCH_SQL = "INSERT OR REPLACE INTO faculty_search (rowid, id, name, specialty, paper) VALUES (?, ?, ?, ?, ?)"
+    _SEARCH_SQL = """
+        SELECT f.data_json FROM faculty f
+        JOIN faculty_search fs ON f.rowid = fs.rowid
+        WHERE faculty_search MATCH :query
+          AND (:institution IS NULL OR f.institution = :institution)
+        ORDER BY bm25(faculty_search)
+        LIMIT :limit
+    """
+
     def __init__(self, db_path="db/faculty_cache.db"):
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # Larger statement cache: the IN (...) lookups in save_faculty vary by batch size
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+        # WAL + NORMAL sync: one fsync per checkpoint instead of per commit.
+        # mmap + a 64MB page cache keep FTS reads out of pread()/buffer copies.
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-64000;
+        """)
         self._create_tables()
+        # data_json -> decoded Faculty, so repeat hits skip json decoding (FIFO-evicted)
+        self._faculty_cache = {}
 
     def _create_tables(self):
         self.conn.execute("""
@@ -30,31 +57,72 @@ class SQLiteStorage(BaseStorage):
                 data_json TEXT
             )
         """)
-        # FTS5 for keyword-based retrieval without API
-        try:
+        # FTS5 for keyword-based retrieval without API.
+        # Bump FTS_SCHEMA_VERSION whenever this definition changes so existing DBs get rebuilt.
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < self.FTS_SCHEMA_VERSION:
+            self._rebuild_search_index()
+
+    def _rebuild_search_index(self):
+        with self.conn:
+            self.conn.execute("DROP TABLE IF EXISTS faculty_search")
+            # porter stemming so "network"/"networks" match; rowid mirrors faculty.rowid
             self.conn.execute("""
                 CREATE VIRTUAL TABLE faculty_search 
-                USING fts5(id UNINDEXED, name, specialty, paper, content=faculty, content_rowid=id)
+                USING fts5(id UNINDEXED, name, specialty, paper, tokenize='porter unicode61 remove_diacritics 2')
             """)
-        except sqlite3.OperationalError:
-            pass 
+            rows_fts = []
+            for rowid, data_json in self.conn.execute("SELECT rowid, data_json FROM faculty").fetchall():
+                f = Faculty(**json_loads(data_json))
+                rows_fts.append((rowid, f.id, f.name, f.specialty, f.top_paper))
+            self.conn.executemany(
+                "INSERT INTO faculty_search (rowid, id, name, specialty, paper) VALUES (?, ?, ?, ?, ?)",
+                rows_fts
+            )
+            self.conn.execute(f"PRAGMA user_version = {self.FTS_SCHEMA_VERSION}")
 
     def save_faculty(self, faculty_list: List[Faculty]):
-        for f in faculty_list:
+        if not faculty_list: return
+        rows_main = [
+            (f.id, f.name, f.h_index, f.last_known_institution, f.to_json())
+            for f in faculty_list
+        ]
+        placeholders = ",".join("?" * len(faculty_list))
+        ids = [f.id for f in faculty_list]
+        # Single transaction; both tables written with one executemany each
+        with self.conn:
+            # REPLACE assigns a fresh rowid, so drop index entries under the old one first
             self.conn.execute(
-                "INSERT OR REPLACE INTO faculty (id, name, h_index, institution, data_json) VALUES (?, ?, ?, ?, ?)",
-                (f.id, f.name, f.h_index, f.last_known_institution, json.dumps(asdict(f)))
+                f"DELETE FROM faculty_search WHERE rowid IN (SELECT rowid FROM faculty WHERE id IN ({placeholders}))",
+                ids
             )
-            self.conn.execute(
-                "INSERT OR REPLACE INTO faculty_search (rowid, name, specialty, paper) VALUES ((SELECT rowid FROM faculty WHERE id=?), ?, ?, ?)",
-                (f.id, f.name, f.specialty, f.top_paper)
-            )
-        self.conn.commit()
-
-    def search_cache(self, keyword: str) -> List[Faculty]:
-        cursor = self.conn.execute("""
-            SELECT f.data_json FROM faculty f
-            JOIN faculty_search fs ON f.id = fs.rowid
-            WHERE faculty_search MATCH ?
-        """, (keyword,))
-        return [Faculty(**json.loads(row[0])) for row in cursor.fetchall()]
+            self.conn.executemany(self._INSERT_FACULTY_SQL, rows_main)
+            # Resolve the new rowids with one query instead of a subquery per row
+            rowids = dict(self.conn.execute(
+                f"SELECT id, rowid FROM faculty WHERE id IN ({placeholders})", ids
+            ))
+            rows_fts = [(rowids[f.id], f.id, f.name, f.specialty, f.top_paper) for f in faculty_list]
+            self.conn.executemany(self._INSERT_SEARCH_SQL, rows_fts)
+
+    def search_cache(self, keywords: List[str], institution: Optional[str] = None,
+                     limit: Optional[int] = None) -> List[Faculty]:
+        if not keywords: return []
+        # Any keyword may match; each is quoted as an FTS5 phrase so punctuation (e.g. "C++") is literal.
+        # institution must equal the stored name exactly
+        # (a phrase match would also let "Purdue University" hit "Purdue University Northwest")
+        cursor = self.conn.execute(self._SEARCH_SQL, {
+            "query": " OR ".join('"{}"'.format(kw.replace('"', '""')) for kw in keywords),
+            "institution": institution or None,
+            "limit": limit or self.SEARCH_LIMIT
+        })
+        # Iterate the cursor directly so rows are decoded as they are stepped, not buffered first
+        return [self._to_faculty(data_json) for (data_json,) in cursor]
+
+    def _to_faculty(self, data_json: str) -> Faculty:
+        # Keyed by the JSON text itself, so an updated row never returns a stale instance
+        faculty = self._faculty_cache.get(data_json)
+        if faculty is None:
+            faculty = Faculty(**json_loads(data_json))
+            if len(self._faculty_cache) >= self.FACULTY_CACHE_SIZE:
+                del self._faculty_cache[next(iter(self._faculty_cache))]
+            self._faculty_cache[data_json] = faculty
+        return faculty
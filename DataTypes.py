@@ -1,8 +1,20 @@
+import json
 from dataclasses import dataclass
 
+# orjson decodes API payloads several times faster; stdlib json is the fallback
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 @dataclass
 class Faculty:
+    # No per-instance __dict__: smaller objects and faster attribute access for cached results.
+    # Spelled out rather than dataclass(slots=True) to stay compatible with Python < 3.10.
+    __slots__ = ("name", "id", "h_index", "specialty", "top_paper", "last_known_institution")
+
     name: str
     id: str
     h_index: int
@@ -10,5 +22,16 @@ class Faculty:
     top_paper: str
     last_known_institution: str
     
+    def to_json(self) -> str:
+        # Fields are flat, so skip asdict()'s recursive copy and build the dict directly
+        return json.dumps({
+            "name": self.name,
+            "id": self.id,
+            "h_index": self.h_index,
+            "specialty": self.specialty,
+            "top_paper": self.top_paper,
+            "last_known_institution": self.last_known_institution
+        })
+
     def __repr__(self):
         return f"<Faculty: {self.name} | h-index: {self.h_index} | Focus: {self.specialty}>"
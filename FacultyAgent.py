@@ -1,24 +1,51 @@
-import requests
-from typing import List, Optional
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import List, Optional, Tuple
 from BaseStorage import BaseStorage
-from DataTypes import Faculty
+from DataTypes import Faculty, json_loads
+from HttpClient import build_session
+
+_BY_H_INDEX = attrgetter("h_index")
 
 
 class FacultyAgent:
-    def __init__(self, storage: BaseStorage, email: Optional[str] = None):
+    # OpenAlex caps OR-filters at 50 ids per request
+    AUTHOR_BATCH_SIZE = 50
+    MAX_WORKERS = 8
+    # Upper bound on /works pages (of 200) scanned for candidate authors
+    MAX_WORK_PAGES = 5
+    # Candidate authors hydrated per query: max(MIN_CANDIDATES, limit * CANDIDATES_PER_RESULT)
+    MIN_CANDIDATES = 20
+    CANDIDATES_PER_RESULT = 2
+    TECHNICAL_FIELDS = frozenset({"Computer Science", "Mathematics", "Engineering"})
+    # OpenAlex ids for TECHNICAL_FIELDS (17 = Computer Science, 26 = Mathematics, 22 = Engineering)
+    TECHNICAL_FIELD_IDS = ("fields/17", "fields/26", "fields/22")
+
+    def __init__(self, storage: BaseStorage, email: Optional[str] = None, api_cache: Optional[str] = None):
         self.storage = storage
         self.base_url = "https://api.openalex.org"
         # Flexible User-Agent: Uses Polite Pool if email provided, otherwise standard
         agent_str = f"FacultyAgent/1.0 (mailto:{email})" if email else "FacultyAgent/1.0"
         self.headers = {"User-Agent": agent_str}
+        # api_cache: optional SQLite path for caching API responses between runs
+        self.session = build_session(self.headers, cache_path=api_cache)
+        # In-process memo for repeat calls: school name -> (id, display_name), author id -> profile
+        self._school_cache = {}
+        self._author_cache = {}
 
     def get_experts(self, school_name: str, keywords: List[str], limit: int = 10) -> List[Faculty]:
         # 1. Resolve Institution ID (Always reliable)
-        inst_res = requests.get(f"{self.base_url}/institutions", 
-                                params={"search": school_name}, headers=self.headers).json()
-        if not inst_res['results']: return []
-        school_id = inst_res['results'][0]['id']
-        school_display = inst_res['results'][0]['display_name']
+        school = self._resolve_school(school_name)
+        if not school: return []
+        school_id, school_display = school
+
+        # 1b. Serve from the local cache only when it can fill the whole request;
+        # a partial hit falls through to the API so callers still get `limit` experts
+        if keywords:
+            cached = self.storage.search_cache(keywords, institution=school_display)
+            if len(cached) >= limit:
+                return heapq.nlargest(limit, cached, key=_BY_H_INDEX)
 
         # 2. Search for WORKS (The "OR" logic)
         # Using "search" finds keywords in title, abstract, or concepts
@@ -26,42 +53,51 @@ class FacultyAgent:
             "filter": f"institutions.id:{school_id}",
             "search": " OR ".join(f'"{kw}"' for kw in keywords), # Force OR logic
             "sort": "cited_by_count:desc",
-            "per_page": 50
+            "select": "title,authorships",
+            "per_page": 200,
+            "cursor": "*"
         }
-        works_data = requests.get(f"{self.base_url}/works", params=works_params, headers=self.headers).json()
-        
+
         # 3. Aggregate Authors from those papers
-        # This identifies who is actually doing the work
+        # This identifies who is actually doing the work. Pages are streamed via cursor
+        # until there are enough candidates for `limit`, bounded by MAX_WORK_PAGES.
+        candidate_cap = max(self.MIN_CANDIDATES, limit * self.CANDIDATES_PER_RESULT)
         author_scores = {} # author_id -> {details}
-        for work in works_data.get('results', []):
-            for authorship in work.get('authorships', []):
-                # Filter for authors specifically at this school
-                is_at_school = any(inst.get('id') == school_id for inst in authorship.get('institutions', []))
-                if is_at_school:
-                    a_id = authorship.get('author', {}).get('id')
-                    if a_id and a_id not in author_scores:
-                        author_scores[a_id] = {
-                            "name": authorship['author']['display_name'],
-                            "top_paper": work.get('title'),
-                            "count": 1
-                        }
-                    elif a_id:
-                        author_scores[a_id]["count"] += 1
+        for _ in range(self.MAX_WORK_PAGES):
+            works_data = json_loads(self.session.get(f"{self.base_url}/works", params=works_params).content)
+            for work in works_data.get('results', []):
+                for authorship in work.get('authorships', []):
+                    # Filter for authors specifically at this school
+                    inst_ids = {inst.get('id') for inst in authorship.get('institutions', ())}
+                    if school_id in inst_ids:
+                        a_id = authorship.get('author', {}).get('id')
+                        if a_id and a_id not in author_scores:
+                            author_scores[a_id] = {
+                                "name": authorship['author']['display_name'],
+                                "top_paper": work.get('title'),
+                                "count": 1
+                            }
+                        elif a_id:
+                            author_scores[a_id]["count"] += 1
+
+            next_cursor = (works_data.get('meta') or {}).get('next_cursor')
+            if not next_cursor or not works_data.get('results') or len(author_scores) >= candidate_cap:
+                break
+            works_params = {**works_params, "cursor": next_cursor}
 
         # 4. Fetch Profiles and filter for Technical Fields
         # We only take the authors who appeared most in our search
-        top_ids = list(author_scores.keys())[:20]
+        top_ids = list(author_scores.keys())[:candidate_cap]
         if not top_ids: return []
 
         verified_list = []
-        author_res = requests.get(f"{self.base_url}/authors", 
-                                 params={"filter": f"id:{'|'.join(top_ids)}"}, headers=self.headers).json()
-
-        technical_fields = ["Computer Science", "Mathematics", "Engineering"]
-        for author in author_res.get('results', []):
-            topics = author.get('topics', [])
-            # Only keep them if they belong to a technical field
-            is_technical = any(t.get('field', {}).get('display_name') in technical_fields for t in topics[:3])
+        for author in self._fetch_authors(top_ids):
+            topics = author.get('topics') or []
+            # Only keep them if they belong to a technical field. The API already dropped authors
+            # with no technical topic at all; this enforces it within their top 3 topics.
+            is_technical = not self.TECHNICAL_FIELDS.isdisjoint(
+                (t.get('field') or {}).get('display_name') for t in topics[:3]
+            )
             
             if is_technical:
                 verified_list.append(Faculty(
@@ -74,6 +110,50 @@ class FacultyAgent:
                 ))
 
         # 5. Commit and Return
-        results = sorted(verified_list, key=lambda x: x.h_index, reverse=True)[:limit]
+        # Partial top-k selection; same order as sorted(..., reverse=True)[:limit]
+        results = heapq.nlargest(limit, verified_list, key=_BY_H_INDEX)
         self.storage.save_faculty(results)
-        return results
\ No newline at end of file
+        return results
+
+    def _resolve_school(self, school_name: str) -> Optional[Tuple[str, str]]:
+        key = school_name.strip().lower()
+        if key not in self._school_cache:
+            inst_res = json_loads(self.session.get(f"{self.base_url}/institutions", 
+                                                   params={"search": school_name}).content)
+            if not inst_res['results']: return None
+            self._school_cache[key] = (inst_res['results'][0]['id'], inst_res['results'][0]['display_name'])
+        return self._school_cache[key]
+
+    def _fetch_authors(self, author_ids: List[str]) -> List[dict]:
+        # Hydrate profiles in batches, issued concurrently so N batches cost ~1 RTT.
+        # Profiles already fetched by this agent are reused instead of re-requested.
+        size = self.AUTHOR_BATCH_SIZE
+        to_fetch = [a for a in author_ids if a not in self._author_cache]
+        batches = [to_fetch[i:i + size] for i in range(0, len(to_fetch), size)]
+
+        def fetch(batch: List[str]) -> dict:
+            params = {
+                "filter": f"id:{'|'.join(batch)},topics.field.id:{'|'.join(self.TECHNICAL_FIELD_IDS)}",
+                "select": "id,display_name,summary_stats,topics",
+                "per_page": size
+            }
+            response = self.session.get(f"{self.base_url}/authors", params=params)
+            # Fail loudly on HTTP errors so nothing from a failed batch is cached
+            response.raise_for_status()
+            return json_loads(response.content)
+
+        if len(batches) <= 1:
+            results = [fetch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(batches))) as ex:
+                results = list(ex.map(fetch, batches))
+        for batch, author_res in zip(batches, results):
+            # Only a real result page proves the server filtered an id out
+            if 'results' not in author_res:
+                continue
+            for author in author_res['results']:
+                self._author_cache[author['id']] = author
+            # Ids the server filtered out are remembered as None so they are not re-requested
+            for a in batch:
+                self._author_cache.setdefault(a, None)
+        return [self._author_cache[a] for a in author_ids if self._author_cache.get(a)]
@@ -0,0 +1,29 @@
+import requests
+from datetime import timedelta
+from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# requests-cache is optional: only needed when a cache_path is requested
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+API_CACHE_TTL = timedelta(hours=24)
+
+
+def build_session(headers: Dict[str, str], cache_path: Optional[str] = None) -> requests.Session:
+    # Pooled keep-alive session: reuses TLS connections across calls and retries transient errors.
+    # With cache_path, successful GETs are also served from a local SQLite cache for API_CACHE_TTL.
+    if cache_path:
+        if CachedSession is None:
+            raise ImportError("api_cache requires the 'requests-cache' package (pip install requests-cache)")
+        session = CachedSession(cache_path, expire_after=API_CACHE_TTL,
+                                allowable_methods=("GET",), allowable_codes=(200,))
+    else:
+        session = requests.Session()
+    session.headers.update(headers)
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=["GET"])
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+    return session
@@ -1,7 +1,39 @@
 import requests
+import heapq
 import json
+import math
+import re
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from DataTypes import json_loads
+from HttpClient import build_session
+
+# Word tokens used for keyword matching (text is lowercased first)
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=64)
+def _phrase_matcher(phrases: frozenset):
+    """
+    Builds (once per keyword set) a regex that finds every whole-word phrase in a single scan.
+    The lookahead reports the longest phrase starting at each position, so overlapping
+    phrases are all found; `implied` maps that longest hit to every phrase it starts with.
+    """
+    if not phrases:
+        return None, {}
+    ordered = sorted(phrases, key=len, reverse=True)
+    alternation = "|".join(map(re.escape, ordered))
+    pattern = re.compile(rf"(?=(?<![a-z0-9])({alternation})(?![a-z0-9]))")
+    implied = {
+        q: {p for p in phrases if q.startswith(p) and not _TOKEN_RE.match(q[len(p):len(p) + 1])}
+        for q in phrases
+    }
+    return pattern, implied
+
+
+_BY_SCORE = itemgetter('relevance_score')
 
 class ResearchAnalystAgent:
     """
@@ -13,11 +45,17 @@ class ResearchAnalystAgent:
     4. Output a structured JSON payload for Agent 3.
     """
 
-    def __init__(self, semanticscholar_api_key: str = None):
+    # Papers older than this are not recommended
+    MIN_YEAR = 2018
+
+    def __init__(self, semanticscholar_api_key: str = None, api_cache: str = None):
         # Public API is free but rate-limited. Add key if high volume needed.
         self.headers = {}
         if semanticscholar_api_key:
             self.headers = {'x-api-key': semanticscholar_api_key}
+
+        # api_cache: optional SQLite path for caching API responses between runs
+        self.session = build_session(self.headers, cache_path=api_cache)
         
         self.base_url = "https://api.semanticscholar.org/graph/v1"
 
@@ -33,16 +71,15 @@ class ResearchAnalystAgent:
         if not raw_papers:
             return {"error": "No papers found or API error."}
 
-        # 2. ANALYZE & RANK
-        scored_papers = self._rank_papers(
+        # 2. ANALYZE, RANK & 3. SELECT (Top 3)
+        # Scoring is streamed straight into a top-3 selection; no fully sorted list is built
+        top_papers = self._rank_papers(
             raw_papers, 
             input_data['student_interests'], 
-            input_data['student_skills']
+            input_data['student_skills'],
+            top_n=3
         )
 
-        # 3. SELECT (Top 3)
-        top_papers = scored_papers[:3]
-
         # 4. FORMAT OUTPUT (for Agent 3)
         output_payload = {
             "professor_name": input_data.get('professor_name', 'Unknown'),
@@ -56,76 +93,96 @@ class ResearchAnalystAgent:
         
         return output_payload
 
-    def _fetch_papers(self, author_id: str, limit: int = 50) -> List[Dict]:
+    def _fetch_papers(self, author_id: str, limit: int = 50, offset: int = 0) -> List[Dict]:
         """
         Fetches the most recent papers with abstracts.
+        Use offset to page through authors with more than `limit` papers.
         """
         endpoint = f"{self.base_url}/author/{author_id}/papers"
         
-        # We request specific fields to minimize payload size
+        # We request specific fields to minimize payload size,
+        # and let the API drop papers older than MIN_YEAR before they are sent
         params = {
             "fields": "title,abstract,year,citationCount,url,isOpenAccess",
-            "limit": limit
+            "publicationDateOrYear": f"{self.MIN_YEAR}:",
+            "limit": limit,
+            "offset": offset
         }
 
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params)
+            response = self.session.get(endpoint, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             return data.get('data', [])
-        except requests.exceptions.RequestException as e:
+        # ValueError covers a non-JSON body (orjson/json decode errors are ValueErrors)
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching papers: {e}")
             return []
 
-    def _rank_papers(self, papers: List[Dict], interests: List[str], skills: List[str]) -> List[Dict]:
+    def _rank_papers(self, papers: Iterable[Dict], interests: List[str], skills: List[str],
+                     top_n: Optional[int] = None) -> List[Dict]:
         """
         The 'Brain' of the agent.
         Scores papers based on keyword overlap with student profile.
+        Returns all scored papers by descending score, or only the best `top_n`.
+        """
+        scored = self._score_papers(papers, interests, skills)
+        if top_n is None:
+            return sorted(scored, key=_BY_SCORE, reverse=True)
+        # Same order as sorted(...)[:top_n], in O(N log top_n)
+        return heapq.nlargest(top_n, scored, key=_BY_SCORE)
+
+    def _score_papers(self, papers: Iterable[Dict], interests: List[str], skills: List[str]) -> Iterator[Dict]:
+        """
+        Yields a scored entry for each paper that passes the filters and scores above 0.
         """
-        ranked = []
-        
         # Combine lists and normalize to lowercase for matching
-        target_keywords = set([k.lower() for k in interests + skills])
+        target_keywords = frozenset(k.lower() for k in interests + skills)
+        # Single-word keywords are matched by set lookup against the paper's tokens;
+        # phrases (or anything with punctuation, e.g. "c++") go through one multi-pattern scan
+        single_kw = {k for k in target_keywords if _TOKEN_RE.fullmatch(k)}
+        phrase_kw = target_keywords - single_kw
+        phrase_re, implied = _phrase_matcher(frozenset(phrase_kw))
         
         for paper in papers:
-            # FILTER: Skip if no abstract or too old (e.g., older than 2018)
-            if not paper.get('abstract') or paper.get('year') is None:
+            # FILTER: Skip if no abstract or too old (server-side filtered too; kept as a cheap safety net)
+            abstract = paper.get('abstract')
+            year = paper.get('year')
+            if not abstract or year is None:
                 continue
-            if paper['year'] < 2018: 
+            if year < self.MIN_YEAR: 
                 continue
+            title = paper['title']
 
             # PREPARE TEXT
-            # We weight the title more heavily (2x) than the abstract
-            text_content = (paper['title'] + " ") * 2 + paper['abstract']
-            text_content = text_content.lower()
+            # Title and abstract are lowercased and tokenized once per paper
+            text_content = f"{title} {abstract}".lower()
+            tokens = set(_TOKEN_RE.findall(text_content))
 
             # SCORING LOGIC
-            score = 0
-            matches = []
-            
-            for keyword in target_keywords:
-                if keyword in text_content:
-                    score += 1
-                    matches.append(keyword)
+            matches = list(single_kw & tokens)
+            if phrase_re:
+                found = set()
+                for longest in set(phrase_re.findall(text_content)):
+                    found |= implied[longest]
+                matches.extend(found)
+            score = len(matches)
             
             # Simple heuristic: Bonus points for high citation count (validation)
-            # Logarithmic scale would be better, but linear / 100 is fine for simple logic
-            citation_boost = min(paper.get('citationCount', 0) / 100.0, 2.0)
+            # Log scale so a few hundred citations don't swamp keyword matches; capped at 2
+            citation_boost = min(math.log1p(paper.get('citationCount') or 0) / 4.0, 2.0)
             
             final_score = score + citation_boost
 
             if final_score > 0:
-                ranked.append({
-                    "title": paper['title'],
-                    "year": paper['year'],
+                yield {
+                    "title": title,
+                    "year": year,
                     "url": paper['url'],
                     "relevance_score": round(final_score, 2),
                     "matched_keywords": matches,
-                    "abstract_snippet": paper['abstract'][:200] + "..." # Truncate for cleaner output
-                })
-
-        # Sort by score descending
-        return sorted(ranked, key=lambda x: x['relevance_score'], reverse=True)
+                    "abstract_snippet": abstract[:200] + "..." # Truncate for cleaner output
+                }
 
 # --- EXAMPLE USAGE ---
 
@@ -0,0 +1,196 @@
+import json
+import pytest
+from BaseStorage import SQLiteStorage
+from DataTypes import Faculty
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def storage():
+    """Create an in-memory SQLite storage."""
+    return SQLiteStorage(db_path=":memory:")
+
+
+def make_faculty(i: int, **overrides):
+    """Factory for Faculty records."""
+    fields = {
+        "name": f"Dr. {i}",
+        "id": f"https://openalex.org/A{i}",
+        "h_index": 10 + i,
+        "specialty": "Machine Learning",
+        "top_paper": f"Paper {i}",
+        "last_known_institution": "MIT",
+    }
+    fields.update(overrides)
+    return Faculty(**fields)
+
+
+# =============================================================================
+# CONNECTION TESTS
+# =============================================================================
+
+class TestConnectionSetup:
+    """Tests for connection pragmas."""
+
+    def test_file_db_uses_wal_and_memory_temp_store(self, tmp_path):
+        """Verifies journaling and temp-store pragmas are applied on open."""
+        storage = SQLiteStorage(db_path=str(tmp_path / "cache.db"))
+
+        assert storage.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert storage.conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert storage.conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert storage.conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+
+
+# =============================================================================
+# SAVE TESTS
+# =============================================================================
+
+class TestSaveFaculty:
+    """Tests for batched writes."""
+
+    def test_save_writes_all_rows(self, storage):
+        """Verifies every faculty in the batch is persisted."""
+        storage.save_faculty([make_faculty(i) for i in range(5)])
+
+        rows = storage.conn.execute("SELECT id, data_json FROM faculty").fetchall()
+        assert len(rows) == 5
+        saved = {row[0]: json.loads(row[1]) for row in rows}
+        assert saved["https://openalex.org/A3"]["name"] == "Dr. 3"
+
+    def test_save_indexes_rows_under_faculty_rowid(self, storage):
+        """Verifies FTS entries are keyed by the matching faculty rowid."""
+        storage.save_faculty([make_faculty(1), make_faculty(2, specialty="Networks")])
+
+        faculty_rowid = storage.conn.execute(
+            "SELECT rowid FROM faculty WHERE id = ?", ("https://openalex.org/A2",)
+        ).fetchone()[0]
+        fts_rowids = storage.conn.execute(
+            "SELECT rowid FROM faculty_search WHERE faculty_search MATCH ?", ("networks",)
+        ).fetchall()
+        assert fts_rowids == [(faculty_rowid,)]
+
+    def test_save_replaces_existing_row(self, storage):
+        """Verifies re-saving the same id updates instead of duplicating."""
+        storage.save_faculty([make_faculty(1)])
+        storage.save_faculty([make_faculty(1, h_index=99)])
+
+        rows = storage.conn.execute("SELECT h_index FROM faculty").fetchall()
+        assert rows == [(99,)]
+
+    def test_save_empty_list(self, storage):
+        """Verifies saving nothing is a no-op."""
+        storage.save_faculty([])
+
+        assert storage.conn.execute("SELECT COUNT(*) FROM faculty").fetchone()[0] == 0
+
+
+# =============================================================================
+# SEARCH TESTS
+# =============================================================================
+
+class TestSearchCache:
+    """Tests for FTS-backed keyword search."""
+
+    def test_search_matches_stemmed_keyword(self, storage):
+        """Verifies porter stemming matches singular/plural forms."""
+        storage.save_faculty([make_faculty(1, specialty="Graph Neural Networks")])
+
+        results = storage.search_cache(["network"])
+
+        assert [f.name for f in results] == ["Dr. 1"]
+
+    def test_search_after_replace_returns_single_row(self, storage):
+        """Verifies re-saving a faculty does not leave stale index entries."""
+        storage.save_faculty([make_faculty(1)])
+        storage.save_faculty([make_faculty(1, h_index=42)])
+
+        results = storage.search_cache(["machine"])
+
+        assert len(results) == 1
+        assert results[0].h_index == 42
+
+    def test_search_ranks_best_match_first(self, storage):
+        """Verifies results come back in bm25 order."""
+        storage.save_faculty([
+            make_faculty(1, specialty="Databases", top_paper="Query Planning"),
+            make_faculty(2, specialty="Robotics", top_paper="Robotics for Robotics"),
+        ])
+
+        results = storage.search_cache(["robotics", "databases"])
+
+        assert results[0].name == "Dr. 2"
+
+    def test_search_filters_by_institution(self, storage):
+        """Verifies the institution filter is applied inside the FTS query."""
+        storage.save_faculty([
+            make_faculty(1, last_known_institution="University of Oxford"),
+            make_faculty(2, last_known_institution="MIT", top_paper="Oxford Comma Detection"),
+        ])
+
+        results = storage.search_cache(["machine learning", "oxford"], institution="University of Oxford")
+
+        assert [f.name for f in results] == ["Dr. 1"]
+
+    def test_institution_filter_is_exact(self, storage):
+        """Verifies institutions whose names contain the searched name are not matched."""
+        storage.save_faculty([
+            make_faculty(1, last_known_institution="Purdue University"),
+            make_faculty(2, last_known_institution="Purdue University Northwest"),
+            make_faculty(3, last_known_institution="University of California, San Diego"),
+        ])
+
+        assert [f.name for f in storage.search_cache(["machine"], institution="Purdue University")] == ["Dr. 1"]
+        assert storage.search_cache(["machine"], institution="University of California") == []
+
+    def test_repeat_search_reuses_decoded_instances(self, storage):
+        """Verifies repeated hits return the cached Faculty instead of re-decoding."""
+        storage.save_faculty([make_faculty(1)])
+
+        first = storage.search_cache(["machine"])
+        second = storage.search_cache(["learning"])
+
+        assert first[0] is second[0]
+
+    def test_updated_row_is_not_served_from_stale_cache(self, storage):
+        """Verifies a re-saved faculty is decoded fresh."""
+        storage.save_faculty([make_faculty(1)])
+        storage.search_cache(["machine"])
+        storage.save_faculty([make_faculty(1, h_index=77)])
+
+        assert storage.search_cache(["machine"])[0].h_index == 77
+
+    def test_search_limit_caps_results(self, storage):
+        """Verifies the per-call limit bounds the number of rows returned."""
+        storage.save_faculty([make_faculty(i) for i in range(5)])
+
+        assert len(storage.search_cache(["machine"])) == 5
+        assert len(storage.search_cache(["machine"], limit=2)) == 2
+
+    def test_search_treats_keywords_literally(self, storage):
+        """Verifies keywords are quoted, so FTS syntax characters and operators are not interpreted."""
+        storage.save_faculty([make_faculty(1, specialty="C++ Compilers")])
+
+        assert [f.name for f in storage.search_cache(["c++", "NOT a (query"])] == ["Dr. 1"]
+        assert storage.search_cache([]) == []
+
+    def test_legacy_index_is_rebuilt(self, tmp_path):
+        """Verifies a DB created with the old FTS schema is migrated and searchable."""
+        db_path = str(tmp_path / "legacy.db")
+        legacy = SQLiteStorage(db_path=db_path)
+        legacy.save_faculty([make_faculty(1, specialty="Cryptography")])
+        legacy.conn.execute("PRAGMA user_version = 0")
+        legacy.conn.execute("DROP TABLE faculty_search")
+        legacy.conn.execute("""
+            CREATE VIRTUAL TABLE faculty_search
+            USING fts5(id UNINDEXED, name, specialty, paper, content=faculty, content_rowid=id)
+        """)
+        legacy.conn.commit()
+        legacy.conn.close()
+
+        storage = SQLiteStorage(db_path=db_path)
+
+        assert [f.name for f in storage.search_cache(["cryptography"])] == ["Dr. 1"]
@@ -1,4 +1,6 @@
+import json
 import pytest
+import requests
 from unittest.mock import MagicMock, patch, call
 from FacultyAgent import FacultyAgent
 from DataTypes import Faculty
@@ -32,6 +34,11 @@ def agent_no_email(mock_storage):
 # MOCK DATA FACTORIES
 # =============================================================================
 
+def mock_response(payload: dict):
+    """Wrap a payload in a mock HTTP response exposing the raw JSON bytes."""
+    return MagicMock(content=json.dumps(payload).encode())
+
+
 def make_institution_response(inst_id: str, display_name: str):
     """Factory for institution API responses."""
     return {"results": [{"id": inst_id, "display_name": display_name}]}
@@ -93,25 +100,51 @@ class TestCacheFunctionality:
         ]
         mock_storage.search_cache.return_value = cached_data
 
-        with patch('requests.get') as mock_get:
-            mock_get.return_value.json.return_value = {"results": []}
-            results = agent.get_experts("MIT", ["machine learning"])
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = mock_response(make_institution_response("I1", "MIT"))
+            results = agent.get_experts("MIT", ["machine learning"], limit=1)
 
-            # Current implementation doesn't use cache, so this tests future behavior
-            # If cache is implemented, it should return cached data
-            assert len(results) >= 0  # Flexible for current implementation
+            assert results == cached_data
+            # Only the institution lookup should hit the API
+            assert mock_get.call_count == 1
+            mock_storage.search_cache.assert_called_once_with(["machine learning"], institution="MIT")
+
+    def test_partial_cache_hit_falls_through_to_api(self, agent, mock_storage):
+        """Verifies a cache holding fewer than `limit` experts does not short-circuit the API."""
+        school_id = "I1"
+        mock_storage.search_cache.return_value = [
+            Faculty("Dr. Cached", "C1", 15, "Machine Learning", "Cached Paper", "MIT")
+        ]
+
+        with patch('requests.Session.get') as mock_get:
+            mock_get.side_effect = [
+                mock_response(make_institution_response(school_id, "MIT")),
+                mock_response(make_works_response([
+                    {"title": "Robot Arms", "authors": [{"id": "A1", "inst_id": school_id}]},
+                    {"title": "ML Systems", "authors": [{"id": "A2", "inst_id": school_id}]}
+                ])),
+                mock_response(make_authors_response([
+                    {"id": "A1", "name": "Dr. Robot", "h_index": 30, "field": "Engineering", "topic": "Robotics"},
+                    {"id": "A2", "name": "Dr. ML", "h_index": 20, "field": "Computer Science", "topic": "ML"}
+                ]))
+            ]
+
+            results = agent.get_experts("MIT", ["machine learning", "robotics"], limit=2)
+
+            assert mock_get.call_count == 3
+            assert [r.name for r in results] == ["Dr. Robot", "Dr. ML"]
 
     def test_storage_save_called_with_results(self, agent, mock_storage):
         """Verifies that results are saved to storage."""
         school_id = "https://openalex.org/I123"
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = [
-                MagicMock(json=lambda: make_institution_response(school_id, "Stanford")),
-                MagicMock(json=lambda: make_works_response([
+                mock_response(make_institution_response(school_id, "Stanford")),
+                mock_response(make_works_response([
                     {"title": "Deep Learning Study", "authors": [{"id": "A1", "inst_id": school_id}]}
                 ])),
-                MagicMock(json=lambda: make_authors_response([
+                mock_response(make_authors_response([
                     {"id": "A1", "name": "Dr. Neural", "h_index": 25, "field": "Computer Science", "topic": "Deep Learning"}
                 ]))
             ]
@@ -126,10 +159,10 @@ class TestCacheFunctionality:
 
     def test_empty_results_still_saves(self, agent, mock_storage):
         """Verifies save is called even with empty results."""
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = [
-                MagicMock(json=lambda: make_institution_response("I1", "Unknown U")),
-                MagicMock(json=lambda: {"results": []}),  # No works found
+                mock_response(make_institution_response("I1", "Unknown U")),
+                mock_response({"results": []}),  # No works found
             ]
 
             results = agent.get_experts("Unknown U", ["quantum"])
@@ -144,18 +177,18 @@ class TestCacheFunctionality:
 class TestMultipleSchools:
     """Tests for different school inputs."""
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_mit_search(self, mock_get, agent):
         """Test searching MIT for robotics experts."""
         school_id = "https://openalex.org/I63966007"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "Massachusetts Institute of Technology")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "Massachusetts Institute of Technology")),
+            mock_response(make_works_response([
                 {"title": "Robot Motion Planning", "authors": [{"id": "A1", "inst_id": school_id}]},
                 {"title": "Autonomous Systems", "authors": [{"id": "A2", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Robot", "h_index": 40, "field": "Engineering", "topic": "Robotics"},
                 {"id": "A2", "name": "Dr. Auto", "h_index": 35, "field": "Computer Science", "topic": "Autonomous Systems"}
             ]))
@@ -167,17 +200,17 @@ class TestMultipleSchools:
         assert results[0].h_index >= results[1].h_index  # Sorted by h_index
         assert results[0].last_known_institution == "Massachusetts Institute of Technology"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_stanford_search(self, mock_get, agent):
         """Test searching Stanford for AI experts."""
         school_id = "https://openalex.org/I97018004"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "Stanford University")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "Stanford University")),
+            mock_response(make_works_response([
                 {"title": "Transformer Networks", "authors": [{"id": "A1", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Attention", "h_index": 80, "field": "Computer Science", "topic": "Natural Language Processing"}
             ]))
         ]
@@ -188,18 +221,18 @@ class TestMultipleSchools:
         assert results[0].name == "Dr. Attention"
         assert results[0].last_known_institution == "Stanford University"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_berkeley_search(self, mock_get, agent):
         """Test searching UC Berkeley for systems experts."""
         school_id = "https://openalex.org/I95457486"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "University of California, Berkeley")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "University of California, Berkeley")),
+            mock_response(make_works_response([
                 {"title": "Distributed Systems at Scale", "authors": [{"id": "A1", "inst_id": school_id}]},
                 {"title": "Database Internals", "authors": [{"id": "A2", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Distributed", "h_index": 55, "field": "Computer Science", "topic": "Distributed Systems"},
                 {"id": "A2", "name": "Dr. Database", "h_index": 45, "field": "Computer Science", "topic": "Databases"}
             ]))
@@ -210,26 +243,26 @@ class TestMultipleSchools:
         assert len(results) == 2
         assert all(r.last_known_institution == "University of California, Berkeley" for r in results)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_unknown_school_returns_empty(self, mock_get, agent):
         """Test that unknown school returns empty list."""
-        mock_get.return_value.json.return_value = {"results": []}
+        mock_get.return_value = mock_response({"results": []})
 
         results = agent.get_experts("Fake University XYZ", ["anything"])
 
         assert results == []
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_international_school(self, mock_get, agent):
         """Test searching an international institution (Oxford)."""
         school_id = "https://openalex.org/I40120149"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "University of Oxford")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "University of Oxford")),
+            mock_response(make_works_response([
                 {"title": "Theoretical Computer Science", "authors": [{"id": "A1", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Theory", "h_index": 30, "field": "Mathematics", "topic": "Algorithms"}
             ]))
         ]
@@ -247,17 +280,17 @@ class TestMultipleSchools:
 class TestInterestCategories:
     """Tests for different interest/keyword combinations."""
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_single_keyword(self, mock_get, agent):
         """Test with a single keyword."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": "Machine Learning Basics", "authors": [{"id": "A1", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. ML", "h_index": 20, "field": "Computer Science", "topic": "Machine Learning"}
             ]))
         ]
@@ -266,19 +299,19 @@ class TestInterestCategories:
 
         assert len(results) == 1
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_multiple_keywords_or_logic(self, mock_get, agent):
         """Test that multiple keywords use OR logic to find broader results."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": "AI Research", "authors": [{"id": "A1", "inst_id": school_id}]},
                 {"title": "ML Applications", "authors": [{"id": "A2", "inst_id": school_id}]},
                 {"title": "Deep Neural Networks", "authors": [{"id": "A3", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. AI", "h_index": 30, "field": "Computer Science", "topic": "AI"},
                 {"id": "A2", "name": "Dr. ML", "h_index": 25, "field": "Computer Science", "topic": "ML"},
                 {"id": "A3", "name": "Dr. DL", "h_index": 20, "field": "Computer Science", "topic": "Deep Learning"}
@@ -289,18 +322,18 @@ class TestInterestCategories:
 
         assert len(results) == 3
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_engineering_keywords(self, mock_get, agent):
         """Test engineering-related keywords."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "Georgia Tech")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "Georgia Tech")),
+            mock_response(make_works_response([
                 {"title": "Embedded Systems Design", "authors": [{"id": "A1", "inst_id": school_id}]},
                 {"title": "VLSI Architecture", "authors": [{"id": "A2", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Embedded", "h_index": 18, "field": "Engineering", "topic": "Embedded Systems"},
                 {"id": "A2", "name": "Dr. VLSI", "h_index": 22, "field": "Engineering", "topic": "VLSI"}
             ]))
@@ -311,18 +344,18 @@ class TestInterestCategories:
         assert len(results) == 2
         assert all(r.specialty in ["Embedded Systems", "VLSI"] for r in results)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_mathematics_keywords(self, mock_get, agent):
         """Test mathematics-related keywords pass the technical filter."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "Princeton")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "Princeton")),
+            mock_response(make_works_response([
                 {"title": "Cryptographic Protocols", "authors": [{"id": "A1", "inst_id": school_id}]},
                 {"title": "Number Theory Applications", "authors": [{"id": "A2", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Crypto", "h_index": 35, "field": "Mathematics", "topic": "Cryptography"},
                 {"id": "A2", "name": "Dr. Number", "h_index": 28, "field": "Mathematics", "topic": "Number Theory"}
             ]))
@@ -332,31 +365,31 @@ class TestInterestCategories:
 
         assert len(results) == 2
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_empty_keywords(self, mock_get, agent):
         """Test with empty keyword list."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: {"results": []}),  # No works for empty search
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response({"results": []}),  # No works for empty search
         ]
 
         results = agent.get_experts("UCLA", [])
 
         assert results == []
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_special_characters_in_keywords(self, mock_get, agent):
         """Test keywords with special characters like C++."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "CMU")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "CMU")),
+            mock_response(make_works_response([
                 {"title": "C++ Performance Optimization", "authors": [{"id": "A1", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. CPP", "h_index": 15, "field": "Computer Science", "topic": "Programming Languages"}
             ]))
         ]
@@ -373,17 +406,17 @@ class TestInterestCategories:
 class TestTechnicalFieldFilter:
     """Tests for the technical field filtering logic."""
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_computer_science_included(self, mock_get, agent):
         """Verifies Computer Science field is included."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": "CS Paper", "authors": [{"id": "A1", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. CS", "h_index": 20, "field": "Computer Science", "topic": "Algorithms"}
             ]))
         ]
@@ -393,17 +426,17 @@ class TestTechnicalFieldFilter:
         assert len(results) == 1
         assert results[0].name == "Dr. CS"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_mathematics_included(self, mock_get, agent):
         """Verifies Mathematics field is included."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": "Math Paper", "authors": [{"id": "A1", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Math", "h_index": 25, "field": "Mathematics", "topic": "Analysis"}
             ]))
         ]
@@ -412,17 +445,17 @@ class TestTechnicalFieldFilter:
 
         assert len(results) == 1
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_engineering_included(self, mock_get, agent):
         """Verifies Engineering field is included."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": "Engineering Paper", "authors": [{"id": "A1", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Eng", "h_index": 18, "field": "Engineering", "topic": "Circuits"}
             ]))
         ]
@@ -431,17 +464,17 @@ class TestTechnicalFieldFilter:
 
         assert len(results) == 1
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_sociology_excluded(self, mock_get, agent):
         """Verifies that Sociology field is excluded."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": "Sociology Paper", "authors": [{"id": "A1", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Soc", "h_index": 30, "field": "Sociology", "topic": "Culture"}
             ]))
         ]
@@ -450,17 +483,17 @@ class TestTechnicalFieldFilter:
 
         assert len(results) == 0
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_biology_excluded(self, mock_get, agent):
         """Verifies that Biology field is excluded."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": "Biology Paper", "authors": [{"id": "A1", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Bio", "h_index": 40, "field": "Biology", "topic": "Genetics"}
             ]))
         ]
@@ -469,19 +502,19 @@ class TestTechnicalFieldFilter:
 
         assert len(results) == 0
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_mixed_fields_filters_correctly(self, mock_get, agent):
         """Test that mixed technical and non-technical fields are filtered correctly."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": "Paper 1", "authors": [{"id": "A1", "inst_id": school_id}]},
                 {"title": "Paper 2", "authors": [{"id": "A2", "inst_id": school_id}]},
                 {"title": "Paper 3", "authors": [{"id": "A3", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. CS", "h_index": 20, "field": "Computer Science", "topic": "AI"},
                 {"id": "A2", "name": "Dr. Psych", "h_index": 25, "field": "Psychology", "topic": "Cognition"},
                 {"id": "A3", "name": "Dr. Math", "h_index": 15, "field": "Mathematics", "topic": "Stats"}
@@ -497,17 +530,17 @@ class TestTechnicalFieldFilter:
         assert "Dr. Math" in names
         assert "Dr. Psych" not in names
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_author_with_no_topics(self, mock_get, agent):
         """Test that author with no topics is excluded."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": "Paper", "authors": [{"id": "A1", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Unknown", "h_index": 10, "field": None, "topic": None}
             ]))
         ]
@@ -516,6 +549,72 @@ class TestTechnicalFieldFilter:
 
         assert len(results) == 0
 
+    @patch('requests.Session.get')
+    def test_technical_field_filter_sent_to_api(self, mock_get, agent):
+        """Verifies the authors request filters to technical fields server-side."""
+        school_id = "I1"
+
+        mock_get.side_effect = [
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
+                {"title": "Paper", "authors": [{"id": "A1", "inst_id": school_id}]}
+            ])),
+            mock_response({"results": []})  # Server dropped the non-technical author
+        ]
+
+        results = agent.get_experts("UCLA", ["anything"])
+
+        author_filter = mock_get.call_args_list[2].kwargs["params"]["filter"]
+        assert author_filter == "id:A1,topics.field.id:fields/17|fields/26|fields/22"
+        assert results == []
+
+    @patch('requests.Session.get')
+    def test_failed_author_fetch_is_not_cached_as_miss(self, mock_get, agent):
+        """Verifies an error on /authors raises and does not poison later lookups."""
+        school_id = "I1"
+        works = make_works_response([
+            {"title": "Paper", "authors": [{"id": "A1", "inst_id": school_id}]}
+        ])
+        failed = mock_response({"error": "Bad request", "message": "Try again"})
+        failed.raise_for_status.side_effect = requests.exceptions.HTTPError("429")
+
+        mock_get.side_effect = [
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(works),
+            failed,
+            mock_response(works),
+            mock_response(make_authors_response([
+                {"id": "A1", "name": "Dr. Retry", "h_index": 9, "field": "Computer Science", "topic": "AI"}
+            ]))
+        ]
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            agent.get_experts("UCLA", ["AI"])
+        results = agent.get_experts("UCLA", ["AI"])
+
+        assert [r.name for r in results] == ["Dr. Retry"]
+
+    @patch('requests.Session.get')
+    def test_response_without_results_is_not_cached_as_miss(self, mock_get, agent):
+        """Verifies a body lacking 'results' does not mark the requested ids as filtered out."""
+        school_id = "I1"
+        works = make_works_response([
+            {"title": "Paper", "authors": [{"id": "A1", "inst_id": school_id}]}
+        ])
+
+        mock_get.side_effect = [
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(works),
+            mock_response({"error": "Bad request", "message": "Try again"}),
+            mock_response(works),
+            mock_response(make_authors_response([
+                {"id": "A1", "name": "Dr. Retry", "h_index": 9, "field": "Computer Science", "topic": "AI"}
+            ]))
+        ]
+
+        assert agent.get_experts("UCLA", ["AI"]) == []
+        assert [r.name for r in agent.get_experts("UCLA", ["AI"])] == ["Dr. Retry"]
+
 
 # =============================================================================
 # EDGE CASES AND ERROR HANDLING
@@ -524,18 +623,18 @@ class TestTechnicalFieldFilter:
 class TestEdgeCases:
     """Tests for edge cases and error scenarios."""
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_limit_parameter(self, mock_get, agent):
         """Test that limit parameter restricts results."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": f"Paper {i}", "authors": [{"id": f"A{i}", "inst_id": school_id}]}
                 for i in range(10)
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": f"A{i}", "name": f"Dr. {i}", "h_index": 50 - i, "field": "Computer Science", "topic": "CS"}
                 for i in range(10)
             ]))
@@ -547,29 +646,29 @@ class TestEdgeCases:
         # Should be sorted by h_index descending
         assert results[0].h_index >= results[1].h_index >= results[2].h_index
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_no_works_found(self, mock_get, agent):
         """Test when no works are found for keywords."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: {"results": []}),
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response({"results": []}),
         ]
 
         results = agent.get_experts("UCLA", ["nonexistent topic xyz"])
 
         assert results == []
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_author_not_at_school(self, mock_get, agent):
         """Test that authors not affiliated with the searched school are excluded."""
         school_id = "I1"
         other_school_id = "I2"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": "Paper", "authors": [
                     {"id": "A1", "inst_id": other_school_id}  # Author at different school
                 ]}
@@ -580,17 +679,17 @@ class TestEdgeCases:
 
         assert results == []
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_missing_h_index(self, mock_get, agent):
         """Test handling of missing h_index in author data."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(make_works_response([
                 {"title": "Paper", "authors": [{"id": "A1", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: {"results": [{
+            mock_response({"results": [{
                 "id": "A1",
                 "display_name": "Dr. NoStats",
                 "summary_stats": None,  # No stats available
@@ -603,14 +702,14 @@ class TestEdgeCases:
         assert len(results) == 1
         assert results[0].h_index == 0  # Should default to 0
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_author_appears_in_multiple_works(self, mock_get, agent):
         """Test that author appearing in multiple works is only counted once."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "UCLA")),
-            MagicMock(json=lambda: {"results": [
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response({"results": [
                 {
                     "title": "Paper 1",
                     "authorships": [{"author": {"id": "A1", "display_name": "Dr. Prolific"}, "institutions": [{"id": school_id}]}]
@@ -624,7 +723,7 @@ class TestEdgeCases:
                     "authorships": [{"author": {"id": "A1", "display_name": "Dr. Prolific"}, "institutions": [{"id": school_id}]}]
                 }
             ]}),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Prolific", "h_index": 50, "field": "Computer Science", "topic": "AI"}
             ]))
         ]
@@ -636,6 +735,93 @@ class TestEdgeCases:
         # First paper title should be stored as top_paper
         assert results[0].top_paper == "Paper 1"
 
+    @patch('requests.Session.get')
+    def test_author_hydration_split_into_batches(self, mock_get, agent):
+        """Test that large candidate pools are hydrated in batches of 50 ids."""
+        school_id = "I1"
+        works = make_works_response([
+            {"title": f"Paper {i}", "authors": [{"id": f"A{i}", "inst_id": school_id}]}
+            for i in range(60)
+        ])
+
+        def respond(url, params=None, **kwargs):
+            if url.endswith("/institutions"):
+                return mock_response(make_institution_response(school_id, "UCLA"))
+            if url.endswith("/works"):
+                return mock_response(works)
+            ids = params["filter"].split(",")[0][len("id:"):].split("|")
+            return mock_response(make_authors_response([
+                {"id": a, "name": f"Dr. {a}", "h_index": int(a[1:]), "field": "Computer Science", "topic": "CS"}
+                for a in ids
+            ]))
+
+        mock_get.side_effect = respond
+
+        results = agent.get_experts("UCLA", ["CS"], limit=30)
+
+        author_calls = [c for c in mock_get.call_args_list if c.args[0].endswith("/authors")]
+        assert len(author_calls) == 2
+        assert len(results) == 30
+        assert results[0].h_index == 59
+
+    @patch('requests.Session.get')
+    def test_works_pagination_follows_cursor_until_enough_authors(self, mock_get, agent):
+        """Test that works pages are followed by cursor and stop once the hydrated candidate cap is met."""
+        school_id = "I1"
+
+        def works_page(start, next_cursor):
+            page = make_works_response([
+                {"title": f"Paper {i}", "authors": [{"id": f"A{i}", "inst_id": school_id}]}
+                for i in range(start, start + 12)
+            ])
+            page["meta"] = {"next_cursor": next_cursor}
+            return page
+
+        mock_get.side_effect = [
+            mock_response(make_institution_response(school_id, "UCLA")),
+            mock_response(works_page(0, "c2")),
+            mock_response(works_page(12, "c3")),
+            mock_response(make_authors_response([
+                {"id": f"A{i}", "name": f"Dr. {i}", "h_index": i, "field": "Computer Science", "topic": "CS"}
+                for i in range(20)
+            ]))
+        ]
+
+        results = agent.get_experts("UCLA", ["CS"], limit=10)
+
+        cursors = [c.kwargs["params"].get("cursor") for c in mock_get.call_args_list[1:3]]
+        assert cursors == ["*", "c2"]
+        assert mock_get.call_count == 4  # stopped after 24 >= 20 candidates
+        # Exactly the collected cap is hydrated; no extra page is fetched only to be discarded
+        author_filter = mock_get.call_args_list[3].kwargs["params"]["filter"]
+        assert len(author_filter.split(",")[0][len("id:"):].split("|")) == 20
+        assert results[0].name == "Dr. 19"
+
+    @patch('requests.Session.get')
+    def test_repeat_calls_reuse_school_and_author_lookups(self, mock_get, agent):
+        """Test that a second query for the same school skips institution and author fetches."""
+        school_id = "I1"
+        works = make_works_response([
+            {"title": "Paper", "authors": [{"id": "A1", "inst_id": school_id}]}
+        ])
+        authors = make_authors_response([
+            {"id": "A1", "name": "Dr. Repeat", "h_index": 12, "field": "Computer Science", "topic": "AI"}
+        ])
+
+        def respond(url, params=None, **kwargs):
+            if url.endswith("/institutions"):
+                return mock_response(make_institution_response(school_id, "UCLA"))
+            return mock_response(works if url.endswith("/works") else authors)
+
+        mock_get.side_effect = respond
+
+        agent.get_experts("UCLA", ["AI"])
+        second = agent.get_experts("ucla", ["robotics"])
+
+        endpoints = [c.args[0].rsplit("/", 1)[-1] for c in mock_get.call_args_list]
+        assert endpoints == ["institutions", "works", "authors", "works"]
+        assert second[0].name == "Dr. Repeat"
+
 
 # =============================================================================
 # USER-AGENT HEADER TESTS
@@ -658,6 +844,32 @@ class TestUserAgentHeaders:
         assert "mailto" not in agent.headers["User-Agent"]
         assert agent.headers["User-Agent"] == "FacultyAgent/1.0"
 
+    def test_session_reuses_headers_and_retries(self, agent):
+        """Test that the pooled session sends the User-Agent and retries transient errors."""
+        assert agent.session.headers["User-Agent"] == agent.headers["User-Agent"]
+        adapter = agent.session.get_adapter("https://api.openalex.org")
+        assert adapter.max_retries.total == 3
+        assert 429 in adapter.max_retries.status_forcelist
+
+    def test_api_cache_uses_cached_session(self, mock_storage):
+        """Test that an api_cache path switches to a TTL-bound requests-cache session."""
+        with patch('HttpClient.CachedSession') as mock_cached:
+            agent = FacultyAgent(storage=mock_storage, api_cache="api_cache.sqlite")
+
+        mock_cached.assert_called_once()
+        assert mock_cached.call_args.args[0] == "api_cache.sqlite"
+        assert agent.session is mock_cached.return_value
+
+    def test_api_cache_without_requests_cache_raises(self, mock_storage):
+        """Test that asking for an api_cache without requests-cache installed fails loudly."""
+        with patch('HttpClient.CachedSession', None):
+            with pytest.raises(ImportError, match="requests-cache"):
+                FacultyAgent(storage=mock_storage, api_cache="api_cache.sqlite")
+
+    def test_no_api_cache_uses_plain_session(self, agent):
+        """Test that responses are not cached on disk unless asked for."""
+        assert type(agent.session) is requests.Session
+
 
 # =============================================================================
 # INTEGRATION-STYLE TESTS (Complex Scenarios)
@@ -666,19 +878,19 @@ class TestUserAgentHeaders:
 class TestComplexScenarios:
     """Tests for complex, multi-faceted scenarios."""
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_full_workflow_multiple_authors_different_h_index(self, mock_get, agent, mock_storage):
         """Test complete workflow with sorting and storage."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "Caltech")),
-            MagicMock(json=lambda: make_works_response([
+            mock_response(make_institution_response(school_id, "Caltech")),
+            mock_response(make_works_response([
                 {"title": "Paper A", "authors": [{"id": "A1", "inst_id": school_id}]},
                 {"title": "Paper B", "authors": [{"id": "A2", "inst_id": school_id}]},
                 {"title": "Paper C", "authors": [{"id": "A3", "inst_id": school_id}]}
             ])),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. Low", "h_index": 10, "field": "Computer Science", "topic": "Graphics"},
                 {"id": "A2", "name": "Dr. High", "h_index": 50, "field": "Computer Science", "topic": "Vision"},
                 {"id": "A3", "name": "Dr. Mid", "h_index": 25, "field": "Engineering", "topic": "Robotics"}
@@ -696,14 +908,14 @@ class TestComplexScenarios:
         # Verify storage was called
         mock_storage.save_faculty.assert_called_once()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_cross_disciplinary_research_team(self, mock_get, agent):
         """Test scenario where a work has multiple authors from same school."""
         school_id = "I1"
 
         mock_get.side_effect = [
-            MagicMock(json=lambda: make_institution_response(school_id, "CMU")),
-            MagicMock(json=lambda: {"results": [{
+            mock_response(make_institution_response(school_id, "CMU")),
+            mock_response({"results": [{
                 "title": "Interdisciplinary AI Paper",
                 "authorships": [
                     {"author": {"id": "A1", "display_name": "Dr. CS"}, "institutions": [{"id": school_id}]},
@@ -711,7 +923,7 @@ class TestComplexScenarios:
                     {"author": {"id": "A3", "display_name": "Dr. Math"}, "institutions": [{"id": school_id}]}
                 ]
             }]}),
-            MagicMock(json=lambda: make_authors_response([
+            mock_response(make_authors_response([
                 {"id": "A1", "name": "Dr. CS", "h_index": 30, "field": "Computer Science", "topic": "ML"},
                 {"id": "A2", "name": "Dr. Robo", "h_index": 25, "field": "Engineering", "topic": "Robotics"},
                 {"id": "A3", "name": "Dr. Math", "h_index": 20, "field": "Mathematics", "topic": "Optimization"}